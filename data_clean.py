@@ -1,3 +1,5 @@
+import os
+
 import pandas as pd
 import numpy as np
 
@@ -81,15 +83,24 @@ def clean_fighter():
     return df
 
 
-if __name__ == "__main__":
+def main(out_dir="."):
     # clean each dataset and save
-    clean_ufc().to_csv("UFC_clean.csv", index=False)
-    clean_event().to_csv("event_clean.csv", index=False)
-    clean_fight().to_csv("fight_clean.csv", index=False)
-    clean_fighter().to_csv("fighter_clean.csv", index=False)
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = {
+        "UFC_clean.csv": clean_ufc,
+        "event_clean.csv": clean_event,
+        "fight_clean.csv": clean_fight,
+        "fighter_clean.csv": clean_fighter,
+    }
+    paths = {}
+    for filename, clean in outputs.items():
+        paths[filename] = filename if out_dir == "." else os.path.join(out_dir, filename)
+        clean().to_csv(paths[filename], index=False)
 
     print("All datasets cleaned and saved:")
-    print("- UFC_clean.csv")
-    print("- event_clean.csv")
-    print("- fight_clean.csv")
-    print("- fighter_clean.csv")
\ No newline at end of file
+    for path in paths.values():
+        print(f"- {path}")
+
+
+if __name__ == "__main__":
+    main()
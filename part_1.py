@@ -1,11 +1,9 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.stats import chi2_contingency
 
 
 TAKEDOWN_THRESHOLD = 1.0  # Fighters with td_avg >= 1.0 are classified as wrestlers
 
-def reach_advantage(ufc_dataset, fighter_dataset):
+def reach_advantage(ufc_dataset, fighter_dataset, plot=True, stats=True):
     ufc_dataset['reach_advantage'] = ufc_dataset['r_reach'] - ufc_dataset['b_reach']
     ufc_dataset['red_win'] = (ufc_dataset['winner'] == ufc_dataset['r_name']).astype(int)
     
@@ -19,32 +17,37 @@ def reach_advantage(ufc_dataset, fighter_dataset):
     print((win_rate_by_bin * 100).round(2))
     
     # statistical test
-    contingency = pd.crosstab(ufc_dataset['reach_bin'], ufc_dataset['red_win'])
-    chi2, p_value, dof, _ = chi2_contingency(contingency)
-    print(f"\nChi-square test: p-value = {p_value:.4f}")
-    if p_value < 0.05:
-        print("✓ Reach advantage is statistically significant")
-    else:
-        print("✗ No significant effect detected")
+    if stats:
+        from scipy.stats import chi2_contingency
+        contingency = pd.crosstab(ufc_dataset['reach_bin'], ufc_dataset['red_win'])
+        chi2, p_value, dof, _ = chi2_contingency(contingency)
+        print(f"\nChi-square test: p-value = {p_value:.4f}")
+        if p_value < 0.05:
+            print("✓ Reach advantage is statistically significant")
+        else:
+            print("✗ No significant effect detected")
     print("=" * 50)
     
 
-    plt.figure(figsize=(12, 6))
-    (win_rate_by_bin * 100).plot(kind='bar', color='steelblue', edgecolor='black')
-    plt.axhline(50, color='red', linestyle='--', linewidth=2, label='50% baseline')
-    plt.xlabel("Reach Advantage (cm)", fontsize=12)
-    plt.ylabel("Red Win Percentage (%)", fontsize=12)
-    plt.title("Myth #1: Does Reach Advantage Predict Wins?", fontsize=14, fontweight='bold')
-    plt.xticks(rotation=45, ha='right')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('myth1_reach_advantage.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if plot:
+        import matplotlib.pyplot as plt
+
+        plt.figure(figsize=(12, 6))
+        (win_rate_by_bin * 100).plot(kind='bar', color='steelblue', edgecolor='black')
+        plt.axhline(50, color='red', linestyle='--', linewidth=2, label='50% baseline')
+        plt.xlabel("Reach Advantage (cm)", fontsize=12)
+        plt.ylabel("Red Win Percentage (%)", fontsize=12)
+        plt.title("Myth #1: Does Reach Advantage Predict Wins?", fontsize=14, fontweight='bold')
+        plt.xticks(rotation=45, ha='right')
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig('myth1_reach_advantage.png', dpi=300, bbox_inches='tight')
+        plt.show()
     
     return ufc_dataset, win_rate_by_bin
 
 
-def youth_beat_experience(ufc_dataset, fighter_dataset):
+def youth_beat_experience(ufc_dataset, fighter_dataset, plot=True, stats=True):
     ufc_dataset['r_dob'] = pd.to_datetime(ufc_dataset['r_dob'], errors='coerce')
     ufc_dataset['b_dob'] = pd.to_datetime(ufc_dataset['b_dob'], errors='coerce')
     ufc_dataset['age_diff'] = (ufc_dataset['r_dob'] - ufc_dataset['b_dob']).dt.days/365.25
@@ -60,32 +63,37 @@ def youth_beat_experience(ufc_dataset, fighter_dataset):
     print((win_rate_by_age_bin * 100).round(2))
     
     # Add statistical test
-    contingency = pd.crosstab(ufc_dataset['age_bin'], ufc_dataset['red_win'])
-    chi2, p_value, dof, _ = chi2_contingency(contingency)
-    print(f"\nChi-square test: p-value = {p_value:.4f}")
-    if p_value < 0.05:
-        print("✓ Age difference is statistically significant")
-    else:
-        print("✗ No significant effect detected")
+    if stats:
+        from scipy.stats import chi2_contingency
+        contingency = pd.crosstab(ufc_dataset['age_bin'], ufc_dataset['red_win'])
+        chi2, p_value, dof, _ = chi2_contingency(contingency)
+        print(f"\nChi-square test: p-value = {p_value:.4f}")
+        if p_value < 0.05:
+            print("✓ Age difference is statistically significant")
+        else:
+            print("✗ No significant effect detected")
     print("=" * 50)
     
-    # visualization
-    plt.figure(figsize=(12, 6))
-    (win_rate_by_age_bin * 100).plot(kind='bar', color='steelblue', edgecolor='black')
-    plt.axhline(50, color='red', linestyle='--', linewidth=2, label='50% baseline')
-    plt.xlabel("Age Difference (Red - Blue) in Years", fontsize=12)
-    plt.ylabel("Red Win Percentage (%)", fontsize=12)
-    plt.title("Myth #2: Does Youth Beat Experience?", fontsize=14, fontweight='bold')
-    plt.xticks(rotation=45, ha='right')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('myth2_youth_vs_experience.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if plot:
+        import matplotlib.pyplot as plt
+
+        # visualization
+        plt.figure(figsize=(12, 6))
+        (win_rate_by_age_bin * 100).plot(kind='bar', color='steelblue', edgecolor='black')
+        plt.axhline(50, color='red', linestyle='--', linewidth=2, label='50% baseline')
+        plt.xlabel("Age Difference (Red - Blue) in Years", fontsize=12)
+        plt.ylabel("Red Win Percentage (%)", fontsize=12)
+        plt.title("Myth #2: Does Youth Beat Experience?", fontsize=14, fontweight='bold')
+        plt.xticks(rotation=45, ha='right')
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig('myth2_youth_vs_experience.png', dpi=300, bbox_inches='tight')
+        plt.show()
     
     return ufc_dataset, win_rate_by_age_bin
 
 
-def wrestlers_vs_strikers(ufc_dataset, fighter_dataset):
+def wrestlers_vs_strikers(ufc_dataset, fighter_dataset, plot=True, stats=True):
     
     ufc_merged = ufc_dataset.copy()
     
@@ -132,35 +140,39 @@ def wrestlers_vs_strikers(ufc_dataset, fighter_dataset):
     print(f"  Total matchups: {n_matchups}")
     
     # Statistical test
-    from scipy.stats import binomtest
-    result = binomtest(wrestler_vs_striker['wrestler_won'].sum(), n_matchups, 0.5)
-    print(f"\nBinomial test: p-value = {result.pvalue:.4f}")
-    if result.pvalue < 0.05:
-        winner = "Wrestlers" if wrestler_win_rate > 0.5 else "Strikers"
-        print(f"{winner} have a statistically significant advantage")
-    else:
-        print(" No significant difference between styles")
+    if stats:
+        from scipy.stats import binomtest
+        result = binomtest(wrestler_vs_striker['wrestler_won'].sum(), n_matchups, 0.5)
+        print(f"\nBinomial test: p-value = {result.pvalue:.4f}")
+        if result.pvalue < 0.05:
+            winner = "Wrestlers" if wrestler_win_rate > 0.5 else "Strikers"
+            print(f"{winner} have a statistically significant advantage")
+        else:
+            print(" No significant difference between styles")
     print("=" * 50)
     
-    # Visualization
-    plt.figure(figsize=(10, 6))
-    styles = ['Wrestler', 'Striker']
-    win_rates = [wrestler_win_rate * 100, (1 - wrestler_win_rate) * 100]
-    plt.bar(styles, win_rates, color=['#d62728', '#1f77b4'], 
-            edgecolor='black', linewidth=2, alpha=0.7)
-    plt.axhline(50, color='black', linestyle='--', linewidth=2, label='50% baseline')
-    plt.ylabel('Win Rate (%) in Cross-Style Matchups', fontsize=12)
-    plt.title('Myth #3: Wrestlers vs Strikers Head-to-Head', fontsize=14, fontweight='bold')
-    plt.ylim(40, 60)
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig('myth3_wrestlers_vs_strikers.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if plot:
+        import matplotlib.pyplot as plt
+
+        # Visualization
+        plt.figure(figsize=(10, 6))
+        styles = ['Wrestler', 'Striker']
+        win_rates = [wrestler_win_rate * 100, (1 - wrestler_win_rate) * 100]
+        plt.bar(styles, win_rates, color=['#d62728', '#1f77b4'], 
+                edgecolor='black', linewidth=2, alpha=0.7)
+        plt.axhline(50, color='black', linestyle='--', linewidth=2, label='50% baseline')
+        plt.ylabel('Win Rate (%) in Cross-Style Matchups', fontsize=12)
+        plt.title('Myth #3: Wrestlers vs Strikers Head-to-Head', fontsize=14, fontweight='bold')
+        plt.ylim(40, 60)
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig('myth3_wrestlers_vs_strikers.png', dpi=300, bbox_inches='tight')
+        plt.show()
     
     return matchup_summary
 
 
-def size_matters(ufc_dataset, fighter_dataset):
+def size_matters(ufc_dataset, fighter_dataset, plot=True):
     # Impact of height and reach by division
     mens_division = ['flyweight', 'bantamweight', 'featherweight', 
                      'lightweight', 'welterweight', 'middleweight', 'light heavyweight', 'heavyweight']
@@ -196,26 +208,29 @@ def size_matters(ufc_dataset, fighter_dataset):
     print(results_df.to_string(index=False))
     print("=" * 50)
     
-    # Visualization
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = range(len(results_df))
-    width = 0.35
-    
-    ax.bar([i - width/2 for i in x], results_df['Height_Corr'], 
-           width, label='Height', alpha=0.7, color='#2ecc71', edgecolor='black')
-    ax.bar([i + width/2 for i in x], results_df['Reach_Corr'], 
-           width, label='Reach', alpha=0.7, color='#3498db', edgecolor='black')
-    ax.axhline(0, color='red', linestyle='--', linewidth=1)
-    ax.set_xlabel('Division', fontsize=12)
-    ax.set_ylabel('Correlation with Winning', fontsize=12)
-    ax.set_title('Myth #4: Does Size Impact Change by Division?', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(results_df['Division'], rotation=45, ha='right')
-    ax.legend()
-    ax.grid(True, alpha=0.3, axis='y')
-    plt.tight_layout()
-    plt.savefig('myth4_size_by_division.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if plot:
+        import matplotlib.pyplot as plt
+
+        # Visualization
+        fig, ax = plt.subplots(figsize=(12, 6))
+        x = range(len(results_df))
+        width = 0.35
+
+        ax.bar([i - width/2 for i in x], results_df['Height_Corr'], 
+               width, label='Height', alpha=0.7, color='#2ecc71', edgecolor='black')
+        ax.bar([i + width/2 for i in x], results_df['Reach_Corr'], 
+               width, label='Reach', alpha=0.7, color='#3498db', edgecolor='black')
+        ax.axhline(0, color='red', linestyle='--', linewidth=1)
+        ax.set_xlabel('Division', fontsize=12)
+        ax.set_ylabel('Correlation with Winning', fontsize=12)
+        ax.set_title('Myth #4: Does Size Impact Change by Division?', fontsize=14, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(results_df['Division'], rotation=45, ha='right')
+        ax.legend()
+        ax.grid(True, alpha=0.3, axis='y')
+        plt.tight_layout()
+        plt.savefig('myth4_size_by_division.png', dpi=300, bbox_inches='tight')
+        plt.show()
     
     return results_df
 
@@ -22,8 +22,7 @@ def merge_red_blue(red_df, blue_df):
     
     
 
-if __name__ == "__main__":
-    ufc_dataset = pd.read_csv("csv/UFC_clean.csv")
+def build_fighter_level_data(ufc_dataset):
     red_corner =red_corner_fighters(ufc_dataset)
     blue_corner = blue_corner_fighters(ufc_dataset)
 
@@ -75,5 +74,12 @@ if __name__ == "__main__":
         .reset_index(0, drop=True).round(2)
     )
    
+    return fighters_df
+
+
+if __name__ == "__main__":
+    ufc_dataset = pd.read_csv("csv/UFC_clean.csv")
+    fighters_df = build_fighter_level_data(ufc_dataset)
+
     # Write merged DataFrame to CSV
     fighters_df.to_csv("csv/fighter_level_data.csv", index=False)
@@ -1,11 +1,5 @@
 import pandas as pd
 
-fighters_df = pd.read_csv("csv/fighter_level_data.csv")  # Load dataset
-
-# Compute fight time
-fighters_df["fight_time_sec"] = (fighters_df["finish_round"] - 1) * 300 + fighters_df["match_time_sec"]
-fighters_df["fight_time_min"] = fighters_df["fight_time_sec"] / 60
-
 wweight_for_strikers = [0.35, 0.35, 0.05, 0.05, 0.20]
 weight_for_grapplers = [0.05, 0.05, 0.35, 0.35, 0.20]
 weight_for_balanced = [0.20, 0.20, 0.20, 0.20, 0.20]
@@ -16,27 +10,33 @@ weight_for_balanced = [0.20, 0.20, 0.20, 0.20, 0.20]
 # 3. td_acc                   -> takedown efficiency
 # 4. control_fraction         -> fraction of fight spent in control
 
-fighters_df["sig_str_landed_per_min"] = fighters_df["sig_str_landed"] / fighters_df["fight_time_min"]  
-fighters_df["sig_str_absorbed_per_min"] = fighters_df["sig_str_absorbed"] / fighters_df["fight_time_min"]  
-fighters_df["td_landed_per_min"] = fighters_df["td_landed"] / fighters_df["fight_time_min"] 
-fighters_df["control_fraction"] = fighters_df["ctrl"] / fighters_df["fight_time_sec"]
-fighters_df["strike_diff_per_min"] = fighters_df["sig_str_landed_per_min"] - fighters_df["sig_str_absorbed_per_min"]
-fighters_df["td_acc_fight"] = (
-    fighters_df["td_landed"] / fighters_df["td_atmpted"]
-)
-fighters_df["td_acc_fight"] = fighters_df["td_acc_fight"].fillna(0)
-
-#zscores for all metric
-fighters_df["strike_diff_z"] = ((fighters_df["strike_diff_per_min"] - fighters_df["strike_diff_per_min"].mean())
-                                 / fighters_df["strike_diff_per_min"].std())
-fighters_df["strike_acc_z"] = ((fighters_df["sig_str_acc"] - fighters_df["sig_str_acc"].mean())
-                                / fighters_df["sig_str_acc"].std())
-fighters_df["td_acc_fight_z"] = (
-    fighters_df["td_acc_fight"] - fighters_df["td_acc_fight"].mean()
-) / fighters_df["td_acc_fight"].std()
-fighters_df["control_fraction_z"] = (
-    fighters_df["control_fraction"] - fighters_df["control_fraction"].mean()
-) / fighters_df["control_fraction"].std()
+def add_fight_metrics(fighters_df):
+    # Compute fight time
+    fighters_df["fight_time_sec"] = (fighters_df["finish_round"] - 1) * 300 + fighters_df["match_time_sec"]
+    fighters_df["fight_time_min"] = fighters_df["fight_time_sec"] / 60
+
+    fighters_df["sig_str_landed_per_min"] = fighters_df["sig_str_landed"] / fighters_df["fight_time_min"]  
+    fighters_df["sig_str_absorbed_per_min"] = fighters_df["sig_str_absorbed"] / fighters_df["fight_time_min"]  
+    fighters_df["td_landed_per_min"] = fighters_df["td_landed"] / fighters_df["fight_time_min"] 
+    fighters_df["control_fraction"] = fighters_df["ctrl"] / fighters_df["fight_time_sec"]
+    fighters_df["strike_diff_per_min"] = fighters_df["sig_str_landed_per_min"] - fighters_df["sig_str_absorbed_per_min"]
+    fighters_df["td_acc_fight"] = (
+        fighters_df["td_landed"] / fighters_df["td_atmpted"]
+    )
+    fighters_df["td_acc_fight"] = fighters_df["td_acc_fight"].fillna(0)
+
+    #zscores for all metric
+    fighters_df["strike_diff_z"] = ((fighters_df["strike_diff_per_min"] - fighters_df["strike_diff_per_min"].mean())
+                                     / fighters_df["strike_diff_per_min"].std())
+    fighters_df["strike_acc_z"] = ((fighters_df["sig_str_acc"] - fighters_df["sig_str_acc"].mean())
+                                    / fighters_df["sig_str_acc"].std())
+    fighters_df["td_acc_fight_z"] = (
+        fighters_df["td_acc_fight"] - fighters_df["td_acc_fight"].mean()
+    ) / fighters_df["td_acc_fight"].std()
+    fighters_df["control_fraction_z"] = (
+        fighters_df["control_fraction"] - fighters_df["control_fraction"].mean()
+    ) / fighters_df["control_fraction"].std()
+    return fighters_df
 
 def group_fight_style(row):
     # Thresholds (interpretable, not learned)
@@ -55,8 +55,6 @@ def group_fight_style(row):
 
     return 'Balanced'
 
-fighters_df['style'] = fighters_df.apply(group_fight_style, axis=1)
-
 # Compute style-weighted performance score
 def compute_style_performance_score(row):
     win_flag = row.get('win_flag', 0)
@@ -76,17 +74,7 @@ def compute_style_performance_score(row):
     )
     return score
 
-fighters_df['style_performance_score'] = fighters_df.apply(compute_style_performance_score, axis=1)
-
-# Min-max scaling to 0-100
-min_score = fighters_df['style_performance_score'].min()
-max_score = fighters_df['style_performance_score'].max()
-fighters_df['performance_0_100'] = 100 * (fighters_df['style_performance_score'] - min_score) / (max_score - min_score)
-
-mean_perf = fighters_df['performance_0_100'].mean()
-std_perf = fighters_df['performance_0_100'].std()
-
-def performance_label(performance):
+def performance_label(performance, mean_perf, std_perf):
     if performance >= mean_perf + 1.5*std_perf:
         return "Exceptional dominance"
     elif performance >= mean_perf + 1.0*std_perf:
@@ -100,14 +88,38 @@ def performance_label(performance):
     else:
         return "Poor dominance"
 
-fighters_df['performance_category'] = fighters_df['performance_0_100'].apply(performance_label)
+def score_performances(fighters_df):
+    fighters_df = add_fight_metrics(fighters_df)
+    fighters_df['style'] = fighters_df.apply(group_fight_style, axis=1)
+    fighters_df['style_performance_score'] = fighters_df.apply(compute_style_performance_score, axis=1)
 
-print(fighters_df[['name', 'style', 'performance_0_100', 'performance_category']].head())
+    # Min-max scaling to 0-100
+    min_score = fighters_df['style_performance_score'].min()
+    max_score = fighters_df['style_performance_score'].max()
+    fighters_df['performance_0_100'] = 100 * (fighters_df['style_performance_score'] - min_score) / (max_score - min_score)
 
-fighter_name = "Ilia Topuria "
-adesanya_fights = fighters_df[fighters_df["name"] == fighter_name].sort_values("fight_number")
-print(
-    adesanya_fights[
+    mean_perf = fighters_df['performance_0_100'].mean()
+    std_perf = fighters_df['performance_0_100'].std()
+    fighters_df['performance_category'] = fighters_df['performance_0_100'].apply(
+        performance_label, args=(mean_perf, std_perf)
+    )
+    return fighters_df
+
+def fighter_performances(fighters_df, fighter_name):
+    # Names in the source data carry stray whitespace (e.g. "Ilia Topuria "),
+    # so match on the stripped, case-folded name.
+    names = fighters_df["name"].str.strip().str.casefold()
+    fighter_fights = fighters_df[names == fighter_name.strip().casefold()].sort_values("fight_number")
+    return fighter_fights[
         ["fight_number", "event_name", "style", "performance_0_100", "performance_category"]
     ]
-)
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    fighters_df = pd.read_csv("csv/fighter_level_data.csv")  # Load dataset
+    fighters_df = score_performances(fighters_df)
+
+    print(fighters_df[['name', 'style', 'performance_0_100', 'performance_category']].head())
+
+    fighter_name = "Ilia Topuria "
+    print(fighter_performances(fighters_df, fighter_name))
@@ -1,24 +1,7 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-
-# Load prepared data
-fighter_df = pd.read_csv("csv/fighter_level_data.csv")
-
-print(f"\n{'='*60}")
-print(f"PRIME WINDOW DETECTION ANALYSIS")
-print(f"{'='*60}")
-print(f"Loaded {len(fighter_df)} fighter-fight records")
-print(f"Unique fighters: {fighter_df['name'].nunique()}")
 
 #minimum 5 fights in the UFC
-min_fights = 5
-fighter_counts = fighter_df['name'].value_counts()
-qualified_fighters = fighter_counts[fighter_counts >= min_fights].index
-fighter_df_filtered = fighter_df[fighter_df['name'].isin(qualified_fighters)].copy()
-
-print(f"Fighters with {min_fights}+ fights: {len(qualified_fighters)}")
-print(f"Total fights analyzed: {len(fighter_df_filtered)}")
+MIN_FIGHTS = 5
 
 def assign_career_stage(fight_number):
     if fight_number <= 5:
@@ -30,21 +13,35 @@ def assign_career_stage(fight_number):
     else:
         return 'Late (16+)'
 
-fighter_df_filtered['career_stage'] = fighter_df_filtered['fight_number'].apply(assign_career_stage)
+# ============================================================
+# STEP 1: Win Rate by Career Stage
+# ============================================================
+
+def career_stage_performance(fighter_df, min_fights=MIN_FIGHTS):
+    fighter_counts = fighter_df['name'].value_counts()
+    qualified_fighters = fighter_counts[fighter_counts >= min_fights].index
+    fighter_df_filtered = fighter_df[fighter_df['name'].isin(qualified_fighters)].copy()
+
+    print(f"Fighters with {min_fights}+ fights: {len(qualified_fighters)}")
+    print(f"Total fights analyzed: {len(fighter_df_filtered)}")
 
-# Calculate average win rate by career stage
-stage_performance = fighter_df_filtered.groupby('career_stage').agg({
-    'win_flag_indicator': 'mean',
-    'age_at_fight': 'mean',  # ← ADD THIS
-    'fight_number': 'count'
-}).round(3)
+    fighter_df_filtered['career_stage'] = fighter_df_filtered['fight_number'].apply(assign_career_stage)
 
-stage_performance.columns = ['Win Rate', 'Average Age', 'Number of Fights']  # ← UPDATE THIS
+    # Calculate average win rate by career stage
+    stage_performance = fighter_df_filtered.groupby('career_stage').agg({
+        'win_flag_indicator': 'mean',
+        'age_at_fight': 'mean',  # ← ADD THIS
+        'fight_number': 'count'
+    }).round(3)
 
-print(f"\n{'='*60}")
-print(f"WIN RATE BY CAREER STAGE")
-print(f"{'='*60}")
-print(stage_performance)
+    stage_performance.columns = ['Win Rate', 'Average Age', 'Number of Fights']  # ← UPDATE THIS
+
+    print(f"\n{'='*60}")
+    print(f"WIN RATE BY CAREER STAGE")
+    print(f"{'='*60}")
+    print(stage_performance)
+
+    return fighter_df_filtered, stage_performance
 
 # ============================================================
 # STEP 2: Find Individual Fighter Peak Windows
@@ -63,71 +60,97 @@ def find_peak_window(fighter_data):
     
     return fighter_data.loc[peak_idx, 'fight_number']
 
-peak_windows = []
+def peak_windows(fighter_df_filtered):
+    windows = []
 
-for fighter_name in qualified_fighters:
-    fighter_data = fighter_df_filtered[fighter_df_filtered['name'] == fighter_name]
-    peak_fight = find_peak_window(fighter_data)
-    
-    if peak_fight is not None:
-        peak_windows.append({
-            'fighter': fighter_name,
-            'peak_fight_number': peak_fight,
-            'total_fights': len(fighter_data)
-        })
-
-peak_df = pd.DataFrame(peak_windows)
-
-print(f"\n{'='*60}")
-print(f"WHEN DO FIGHTERS PEAK?")
-print(f"{'='*60}")
-print(f"Average peak occurs at fight: {peak_df['peak_fight_number'].mean():.1f}")
-print(f"Median peak occurs at fight: {peak_df['peak_fight_number'].median():.1f}")
-print(f"Most common peak fight: {peak_df['peak_fight_number'].mode().values[0]}")
+    for fighter_name, fighter_data in fighter_df_filtered.groupby('name', sort=False):
+        peak_fight = find_peak_window(fighter_data)
+
+        if peak_fight is not None:
+            windows.append({
+                'fighter': fighter_name,
+                'peak_fight_number': peak_fight,
+                'total_fights': len(fighter_data)
+            })
+
+    peak_df = pd.DataFrame(windows)
+
+    print(f"\n{'='*60}")
+    print(f"WHEN DO FIGHTERS PEAK?")
+    print(f"{'='*60}")
+    print(f"Average peak occurs at fight: {peak_df['peak_fight_number'].mean():.1f}")
+    print(f"Median peak occurs at fight: {peak_df['peak_fight_number'].median():.1f}")
+    print(f"Most common peak fight: {peak_df['peak_fight_number'].mode().values[0]}")
+
+    return peak_df
 
 # ============================================================
 # STEP 3: Visualize Peak Distribution
 # ============================================================
 
-plt.figure(figsize=(14, 6))
-
-# Histogram of when fighters peak
-plt.subplot(1, 2, 1)
-plt.hist(peak_df['peak_fight_number'], bins=20, edgecolor='black', alpha=0.7, color='steelblue')
-plt.xlabel('Fight Number at Peak Performance', fontsize=11)
-plt.ylabel('Number of Fighters', fontsize=11)
-plt.title('Distribution of Peak Performance Timing', fontsize=13, fontweight='bold')
-plt.axvline(peak_df['peak_fight_number'].mean(), color='red', linestyle='--', 
-            linewidth=2, label=f'Mean: {peak_df["peak_fight_number"].mean():.1f}')
-plt.axvline(peak_df['peak_fight_number'].median(), color='orange', linestyle='--', 
-            linewidth=2, label=f'Median: {peak_df["peak_fight_number"].median():.1f}')
-plt.legend()
-plt.grid(True, alpha=0.3)
-
-# Win rate by career stage
-plt.subplot(1, 2, 2)
-stage_order = ['Early (1-5)', 'Mid (6-10)', 'Prime (11-15)', 'Late (16+)']
-stage_data = stage_performance.loc[stage_order, 'Win Rate']
-bars = plt.bar(range(len(stage_data)), stage_data, edgecolor='black', alpha=0.7, color='coral')
-plt.xlabel('Career Stage', fontsize=11)
-plt.ylabel('Win Rate', fontsize=11)
-plt.title('Win Rate by Career Stage', fontsize=13, fontweight='bold')
-plt.xticks(range(len(stage_data)), stage_order, rotation=45, ha='right')
-plt.ylim(0, 1)
-plt.grid(True, alpha=0.3, axis='y')
-
-# Add value labels on bars
-for i, bar in enumerate(bars):
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height,
-             f'{height:.3f}', ha='center', va='bottom', fontsize=10)
-
-plt.tight_layout()
-plt.savefig('prime_window_analysis.png', dpi=300, bbox_inches='tight')
-print(f"\n✅ Saved visualization: prime_window_analysis.png")
-
-plt.show()
-
-print(f"\n{'='*60}")
-print(f"ANALYSIS COMPLETE")
-print(f"{'='*60}\n")
+def plot_prime_window(peak_df, stage_performance):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(14, 6))
+
+    # Histogram of when fighters peak
+    plt.subplot(1, 2, 1)
+    plt.hist(peak_df['peak_fight_number'], bins=20, edgecolor='black', alpha=0.7, color='steelblue')
+    plt.xlabel('Fight Number at Peak Performance', fontsize=11)
+    plt.ylabel('Number of Fighters', fontsize=11)
+    plt.title('Distribution of Peak Performance Timing', fontsize=13, fontweight='bold')
+    plt.axvline(peak_df['peak_fight_number'].mean(), color='red', linestyle='--', 
+                linewidth=2, label=f'Mean: {peak_df["peak_fight_number"].mean():.1f}')
+    plt.axvline(peak_df['peak_fight_number'].median(), color='orange', linestyle='--', 
+                linewidth=2, label=f'Median: {peak_df["peak_fight_number"].median():.1f}')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+    # Win rate by career stage
+    plt.subplot(1, 2, 2)
+    stage_order = ['Early (1-5)', 'Mid (6-10)', 'Prime (11-15)', 'Late (16+)']
+    stage_data = stage_performance.loc[stage_order, 'Win Rate']
+    bars = plt.bar(range(len(stage_data)), stage_data, edgecolor='black', alpha=0.7, color='coral')
+    plt.xlabel('Career Stage', fontsize=11)
+    plt.ylabel('Win Rate', fontsize=11)
+    plt.title('Win Rate by Career Stage', fontsize=13, fontweight='bold')
+    plt.xticks(range(len(stage_data)), stage_order, rotation=45, ha='right')
+    plt.ylim(0, 1)
+    plt.grid(True, alpha=0.3, axis='y')
+
+    # Add value labels on bars
+    for i, bar in enumerate(bars):
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{height:.3f}', ha='center', va='bottom', fontsize=10)
+
+    plt.tight_layout()
+    plt.savefig('prime_window_analysis.png', dpi=300, bbox_inches='tight')
+    print(f"\n✅ Saved visualization: prime_window_analysis.png")
+
+    plt.show()
+
+def prime_window_detection(fighter_df, plot=True):
+    print(f"\n{'='*60}")
+    print(f"PRIME WINDOW DETECTION ANALYSIS")
+    print(f"{'='*60}")
+    print(f"Loaded {len(fighter_df)} fighter-fight records")
+    print(f"Unique fighters: {fighter_df['name'].nunique()}")
+
+    fighter_df_filtered, stage_performance = career_stage_performance(fighter_df)
+    peak_df = peak_windows(fighter_df_filtered)
+
+    if plot:
+        plot_prime_window(peak_df, stage_performance)
+
+    print(f"\n{'='*60}")
+    print(f"ANALYSIS COMPLETE")
+    print(f"{'='*60}\n")
+
+    return stage_performance, peak_df
+
+
+if __name__ == "__main__":
+    # Load prepared data
+    fighter_df = pd.read_csv("csv/fighter_level_data.csv")
+    prime_window_detection(fighter_df)
@@ -0,0 +1,56 @@
+import os
+
+import pandas as pd
+import pytest
+
+from ufc_analysis import CACHE_DIR, load_dataset
+
+
+def _write_csv(data_dir, rows, mtime):
+    path = data_dir / "UFC_clean.csv"
+    pd.DataFrame({"r_name": [f"F{i}" for i in range(rows)]}).to_csv(path, index=False)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _pickle_path(data_dir):
+    return data_dir / CACHE_DIR / "UFC_clean.pkl"
+
+
+def test_stale_pickle_is_rebuilt(tmp_path):
+    _write_csv(tmp_path, 3, mtime=1_000_000)
+    assert len(load_dataset("UFC_clean.csv", tmp_path)) == 3
+    os.utime(_pickle_path(tmp_path), (1_000_100, 1_000_100))
+
+    _write_csv(tmp_path, 5, mtime=1_000_200)
+
+    assert len(load_dataset("UFC_clean.csv", tmp_path)) == 5
+    assert len(pd.read_pickle(_pickle_path(tmp_path))) == 5
+
+
+def test_truncated_pickle_falls_back_to_csv(tmp_path):
+    _write_csv(tmp_path, 4, mtime=1_000_000)
+    pickle_path = _pickle_path(tmp_path)
+    pickle_path.parent.mkdir()
+    pickle_path.write_bytes(b"\x80\x05")  # a pickle cut off mid-write
+
+    assert len(load_dataset("UFC_clean.csv", tmp_path)) == 4
+    assert len(pd.read_pickle(pickle_path)) == 4
+    assert os.listdir(pickle_path.parent) == ["UFC_clean.pkl"]
+
+
+def test_store_without_csv_is_used(tmp_path):
+    pickle_path = _pickle_path(tmp_path)
+    pickle_path.parent.mkdir()
+    pd.DataFrame({"r_name": ["A", "B"]}).to_pickle(pickle_path)
+
+    assert list(load_dataset("UFC_clean.csv", tmp_path)["r_name"]) == ["A", "B"]
+
+
+@pytest.mark.parametrize("filename, step", [
+    ("UFC_clean.csv", "clean"),
+    ("fighter_level_data.csv", "fighters"),
+])
+def test_missing_dataset_names_the_step_that_writes_it(tmp_path, filename, step):
+    with pytest.raises(FileNotFoundError, match=f"{filename}.*'{step}'"):
+        load_dataset(filename, tmp_path)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+"""Command line entry point for the UFC analyses.
+
+    python ufc_analysis.py reach|age|styles|size|prime|velocity|fighters|clean [options]
+
+Only the standard library is imported up front; pandas, scipy and matplotlib
+are pulled in by the subcommand that needs them. Plots (--plot) and
+significance tests (--stats) are opt-in. Run with --help for the options of
+each subcommand.
+"""
+import argparse
+import os
+import sys
+
+DATA_DIR = "csv"
+CACHE_DIR = ".cache"
+FIGHTER_LEVEL_DATA = "fighter_level_data.csv"
+
+# Subcommand that writes each dataset, for the "not found" message.
+PRODUCED_BY = {FIGHTER_LEVEL_DATA: "fighters"}
+
+
+def _is_fresh(path, source):
+    # With no CSV beside it the store is the only copy there is, so use it.
+    if not os.path.exists(path):
+        return False
+    return not os.path.exists(source) or os.path.getmtime(path) >= os.path.getmtime(source)
+
+
+def load_dataset(filename, data_dir=DATA_DIR):
+    # Fastest store first: parquet (if an engine is installed), then the
+    # pickle cache, then the CSV itself (which refreshes the pickle cache).
+    # A store that fails to read (half-written, other pandas version, no
+    # engine) falls through to the next one.
+    import pandas as pd
+
+    csv_path = os.path.join(data_dir, filename)
+    stem = os.path.splitext(filename)[0]
+
+    parquet_path = os.path.join(data_dir, stem + ".parquet")
+    if _is_fresh(parquet_path, csv_path):
+        try:
+            return pd.read_parquet(parquet_path)
+        except Exception:
+            pass
+
+    pickle_path = os.path.join(data_dir, CACHE_DIR, stem + ".pkl")
+    if _is_fresh(pickle_path, csv_path):
+        try:
+            return pd.read_pickle(pickle_path)
+        except Exception:
+            pass
+
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(
+            f"{filename} not found in {data_dir!r}; pass --data-dir or run "
+            f"'{PRODUCED_BY.get(filename, 'clean')}' first"
+        )
+
+    df = pd.read_csv(csv_path)
+    # Write beside the final path and rename, so concurrent runs never see
+    # a partial pickle.
+    tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(pickle_path), exist_ok=True)
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, pickle_path)
+    except OSError:
+        pass  # read-only data dir, just skip the cache
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+
+def _run_part_1(analysis, args, **kwargs):
+    import part_1
+
+    # None of the part_1 analyses read fighter_dataset, so skip loading it.
+    ufc_dataset = load_dataset("UFC_clean.csv", args.data_dir)
+    getattr(part_1, analysis)(ufc_dataset, None, plot=args.plot, **kwargs)
+
+
+def cmd_reach(args):
+    _run_part_1("reach_advantage", args, stats=args.stats)
+
+
+def cmd_age(args):
+    _run_part_1("youth_beat_experience", args, stats=args.stats)
+
+
+def cmd_styles(args):
+    _run_part_1("wrestlers_vs_strikers", args, stats=args.stats)
+
+
+def cmd_size(args):
+    _run_part_1("size_matters", args)
+
+
+def cmd_prime(args):
+    from part_2_phase_2.prime_window_detection import prime_window_detection
+
+    fighter_df = load_dataset(FIGHTER_LEVEL_DATA, args.data_dir)
+    prime_window_detection(fighter_df, plot=args.plot)
+
+
+def cmd_velocity(args):
+    from part_2_phase_2.improvement_velocity import fighter_performances, score_performances
+
+    fighters_df = score_performances(load_dataset(FIGHTER_LEVEL_DATA, args.data_dir))
+    if args.fighter:
+        result = fighter_performances(fighters_df, args.fighter)
+        if result.empty:
+            print(f"ufc-analysis: error: no fights found for {args.fighter!r}", file=sys.stderr)
+            return 1
+    else:
+        result = fighters_df[['name', 'style', 'performance_0_100', 'performance_category']].head()
+    print(result.to_string(index=False))
+
+
+def cmd_fighters(args):
+    from part_2_phase_1 import build_fighter_level_data
+
+    fighters_df = build_fighter_level_data(load_dataset("UFC_clean.csv", args.data_dir))
+    path = os.path.join(args.data_dir, FIGHTER_LEVEL_DATA)
+    fighters_df.to_csv(path, index=False)
+    print(f"- {path}")
+
+
+def cmd_clean(args):
+    import data_clean
+
+    data_clean.main(args.data_dir)
+    cmd_fighters(args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="ufc-analysis", description="UFC fight analyses")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, help_text, needs, plot=True, stats=False):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--data-dir", default=DATA_DIR,
+                         help=f"directory holding {needs} (default: {DATA_DIR})")
+        if plot:
+            sub.add_argument("--plot", action="store_true", help="also draw and save the figure")
+        if stats:
+            sub.add_argument("--stats", action="store_true",
+                             help="also run the significance test (imports scipy)")
+        sub.set_defaults(func=func)
+        return sub
+
+    add("reach", cmd_reach, "Myth #1: reach advantage", "UFC_clean.csv", stats=True)
+    add("age", cmd_age, "Myth #2: youth vs experience", "UFC_clean.csv", stats=True)
+    add("styles", cmd_styles, "Myth #3: wrestlers vs strikers", "UFC_clean.csv", stats=True)
+    add("size", cmd_size, "Myth #4: size by division", "UFC_clean.csv")
+    add("prime", cmd_prime, "prime window detection", FIGHTER_LEVEL_DATA)
+    velocity = add("velocity", cmd_velocity, "style-weighted performance scores",
+                   FIGHTER_LEVEL_DATA, plot=False)
+    velocity.add_argument("--fighter", help="show the fight-by-fight scores for one fighter")
+    add("fighters", cmd_fighters, f"build {FIGHTER_LEVEL_DATA} from UFC_clean.csv",
+        f"UFC_clean.csv; {FIGHTER_LEVEL_DATA} is written there too", plot=False)
+    add("clean", cmd_clean,
+        f"clean the raw CSVs in the working directory, then build {FIGHTER_LEVEL_DATA}",
+        f"the cleaned CSVs and {FIGHTER_LEVEL_DATA} this step writes", plot=False)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except FileNotFoundError as exc:
+        parser.error(str(exc))
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); silence the flush at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())